@@ -38,6 +38,7 @@ from ..schemas.commands import (
     RETURN_TOOL,
     SEND_WEBHOOK,
     SWAP_TO_TOOL,
+    TCODE_ADAPTER,
     WAIT,
     TCode,
 )
@@ -52,6 +53,7 @@ from ..schemas.common import (
     WellPartType,
 )
 from ..schemas.descriptions import (
+    LABWARE_DESCRIPTION_ADAPTER,
     AxisAlignedRectangleDescription,
     AxisAlignedRectangleDescriptor,
     CircleDescription,
@@ -128,6 +130,7 @@ __all__ = [
     "DELETE_LABWARE",
     "DISCARD_PIPETTE_TIP_GROUP",
     "DISPENSE",
+    "LABWARE_DESCRIPTION_ADAPTER",
     "MOVE_GRIPPER",
     "MOVE_TO_JOINT_POSE",
     "MOVE_TO_LOCATION",
@@ -144,6 +147,7 @@ __all__ = [
     "RETURN_TOOL",
     "SEND_WEBHOOK",
     "SWAP_TO_TOOL",
+    "TCODE_ADAPTER",
     "WAIT",
     "AxisAlignedRectangleDescription",
     "AxisAlignedRectangleDescriptor",
@@ -1,12 +1,15 @@
 """Various helpful components for creating command-line interfaces for TCode scripts."""
 
+import functools
 import pathlib
 
 import plac  # type: ignore [import-untyped]
 
 DEFAULT_SERVICER_URL = "http://localhost:8002"
+SERVICER_URL_SCHEMES = ("http://", "https://")
 
 
+@functools.lru_cache(maxsize=256)
 def validate_servicer_url(value: str) -> str:
     """Validate that the servicer URL is well-formed.
 
@@ -20,7 +23,7 @@ def validate_servicer_url(value: str) -> str:
         ValueError: If any of the following conditions aren't met:
             - The URL starts with "http://" or "https://".
     """
-    if not value.startswith("http://") and not value.startswith("https://"):
+    if not value.startswith(SERVICER_URL_SCHEMES):
         raise ValueError("Servicer URL must start with 'http://' or 'https://'")
     return value
 
@@ -6,9 +6,9 @@ Resources:
 """
 
 import enum
-from typing import Annotated, Literal, Self
+from typing import Annotated, Final, Literal, Self
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class _TCodeResultReportBase(BaseModel):
@@ -117,13 +117,13 @@ class ResolverResult(_TCodeResultReportBase):
     @classmethod
     def ok(cls, message: str = "", details: dict | None = None) -> Self:
         """Create a successful result."""
-        details = details or {}
+        details = {} if details is None else details
         return cls(success=True, code=ResolverCode.SUCCESS, message=message, details=details)
 
     @classmethod
     def error(cls, code: ResolverCode, message: str, details: dict | None = None) -> Self:
         """Create a result containing an error. Enforces good exception practices through mandatory args."""
-        details = details or {}
+        details = {} if details is None else details
         return cls(success=False, code=code, message=message, details=details)
 
 
@@ -153,13 +153,13 @@ class ExecutionResult(_TCodeResultReportBase):
     @classmethod
     def ok(cls, details: dict | None = None) -> Self:
         """Create a successful result."""
-        details = details or {}
+        details = {} if details is None else details
         return cls(success=True, code=ExecutionCode.SUCCESS, message="", details=details)
 
     @classmethod
     def error(cls, code: ExecutionCode, message: str, details: dict | None = None) -> Self:
         """Create a result containing an error. Enforces good exception practices through mandatory args."""
-        details = details or {}
+        details = {} if details is None else details
         return cls(success=False, code=code, message=message, details=details)
 
     def __repr__(self) -> str:
@@ -173,6 +173,10 @@ TCodeResultReport = Annotated[
     Field(discriminator="type"),
 ]
 
+# Building a TypeAdapter generates a core schema, so share one instance rather than constructing
+# adapters per (de)serialization call.
+TCODE_RESULT_REPORT_ADAPTER: Final[TypeAdapter[TCodeResultReport]] = TypeAdapter(TCodeResultReport)
+
 
 class UnitsError(Exception):
     """Exception raised for errors in unit conversions."""
@@ -34,7 +34,7 @@ from .return_pipette_tip_group.latest import RETURN_PIPETTE_TIP_GROUP
 from .return_tool.latest import RETURN_TOOL
 from .send_webhook.latest import SEND_WEBHOOK
 from .swap_to_tool.latest import SWAP_TO_TOOL
-from .union import TCode
+from .union import TCODE_ADAPTER, TCode
 from .wait.latest import WAIT
 
 __all__ = [
@@ -68,6 +68,7 @@ __all__ = [
     "RETURN_TOOL",
     "SEND_WEBHOOK",
     "SWAP_TO_TOOL",
+    "TCODE_ADAPTER",
     "WAIT",
     "TCode",
 ]
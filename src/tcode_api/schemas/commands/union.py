@@ -1,6 +1,6 @@
-from typing import Annotated
+from typing import Annotated, Final
 
-from pydantic import Field
+from pydantic import Field, TypeAdapter
 
 from .add_labware.latest import ADD_LABWARE
 from .add_pipette_tip_group.latest import ADD_PIPETTE_TIP_GROUP
@@ -82,3 +82,7 @@ TCode = Annotated[
     | WAIT,
     Field(discriminator="type", description="Union type of all valid TCode commands."),
 ]
+
+# Canonical entry point for validating/serializing individual TCode commands. Built eagerly at
+# import so that no caller pays the core-schema build for the 30+ member union on a hot path.
+TCODE_ADAPTER: Final[TypeAdapter[TCode]] = TypeAdapter(TCode)
@@ -6,6 +6,8 @@ A future refactor will move this behavior more explicitly into domain models.
 
 from __future__ import annotations
 
+import functools
+import math
 from typing import Literal
 
 from pint import Unit
@@ -16,6 +18,81 @@ from tcode_api.units import Q_
 
 from ..base import BaseConfiguredModel
 
+# pint re-parses unit strings and builds Quantity objects on every operation, which dominates
+# mixed-unit arithmetic. The helpers below cache the factors pint itself would apply to plain
+# scalable units. Temperatures still go through pint, which applies its own offset rules to them.
+
+
+@functools.lru_cache(maxsize=512)
+def _is_scalable(units: str) -> bool:
+    """Whether ``units`` converts by a plain factor that the fast paths may apply themselves.
+
+    :note: Relies on pint's private ``Quantity._is_multiplicative``; revisit when bumping pint.
+    """
+    quantity = Q_(1.0, units)
+    # kelvin and delta_degC are multiplicative, but pint still picks result units for mixed
+    # temperature arithmetic by its offset rules, so every temperature is left to pint.
+    return quantity._is_multiplicative and "[temperature]" not in quantity.dimensionality
+
+
+@functools.lru_cache(maxsize=512)
+def _conversion_factor(from_units: str, to_units: str) -> float:
+    """Factor converting a magnitude in ``from_units`` to ``to_units``.
+
+    :raises DimensionalityError: If the units are incompatible.
+    """
+    return Q_(1.0, from_units).to(to_units).magnitude
+
+
+@functools.lru_cache(maxsize=512)
+def _root_factor(units: str) -> float:
+    """Factor converting a magnitude in ``units`` to pint's root units."""
+    return Q_(1.0, units).to_root_units().magnitude
+
+
+@functools.lru_cache(maxsize=512)
+def _root_scale(units: str) -> tuple[float, bool]:
+    """Scale taking a magnitude in ``units`` to root units, as ``(scale, divide)``.
+
+    Sub-unit factors such as 1e-6 are inexact in binary, so ``7000 * 1e-6 != 7 * 1e-3``. Where the
+    inverse factor is a whole number (as for metric prefixes), dividing by it rounds correctly,
+    so equal quantities written in different units land on the same root magnitude.
+    """
+    factor = _root_factor(units)
+    if factor < 1:
+        inverse = round(1 / factor)
+        if inverse and math.isclose(1 / factor, inverse, rel_tol=1e-9):
+            return float(inverse), True
+    return factor, False
+
+
+def _root_magnitude(magnitude: float, units: str) -> float:
+    """``magnitude`` in ``units`` expressed in pint's root units."""
+    scale, divide = _root_scale(units)
+    return magnitude / scale if divide else magnitude * scale
+
+
+@functools.lru_cache(maxsize=512)
+def _root_units(units: str) -> str:
+    """Units string of pint's root units for ``units`` (ex. ``"mL"`` -> ``"meter ** 3"``)."""
+    return str(Q_(1.0, units).to_root_units().units)
+
+
+@functools.lru_cache(maxsize=512)
+def _canonical_units(units: str) -> str:
+    """Units string pint reports for ``units`` (ex. ``"mL"`` -> ``"milliliter"``)."""
+    return str(Q_(1.0, units).units)
+
+
+@functools.lru_cache(maxsize=256)
+def _unit_str(units: Unit) -> str:
+    """``str(units)``; pint re-renders the units through its registry on every call."""
+    return str(units)
+
+
+def _both_scalable(a: str, b: str) -> bool:
+    return _is_scalable(a) and _is_scalable(b)
+
 
 class ValueWithUnits(BaseConfiguredModel):
     """A numeric value with associated units.
@@ -37,9 +114,17 @@ class ValueWithUnits(BaseConfiguredModel):
     magnitude: float
     units: str
 
-    def __hash__(self):
-        # TODO (connor): Mia mentioned that this can produce collisions, fix.
-        return hash(self.magnitude) ^ hash(self.units)
+    def __hash__(self) -> int:
+        # Equal values may be expressed in different units (5 mL == 0.005 L). Mixed-unit __eq__
+        # compares root-unit magnitudes, so hashing that same magnitude keeps the two consistent.
+        try:
+            if _is_scalable(self.units):
+                return hash((_root_units(self.units), _root_magnitude(self.magnitude, self.units)))
+            # Temperatures compare through pint's offset rules, so only the dimension is stable.
+            return hash(_root_units(self.units))
+        except Exception:
+            # Units pint cannot parse only ever compare equal to the same units string.
+            return hash(self.units)
 
     def __str__(self) -> str:
         return f"{self.magnitude} {self.units}"
@@ -51,10 +136,16 @@ class ValueWithUnits(BaseConfiguredModel):
         :param units: The units to convert to.
 
         """
+        if not isinstance(units, str):
+            # pint compares a Unit to a string by parsing it, so "mL" matches Unit("milliliter").
+            if _unit_str(units) == _canonical_units(self.units):
+                return self.model_copy()
+            units = _unit_str(units)
         if units == self.units:
             return self.model_copy()
-        if str(units) == self.units:
-            return self.model_copy()
+        if _both_scalable(self.units, units):
+            factor = _conversion_factor(self.units, units)
+            return ValueWithUnits(magnitude=self.magnitude * factor, units=units)
         pint_quantity = Q_(self.magnitude, self.units).to(units)
         return ValueWithUnits(magnitude=pint_quantity.magnitude, units=str(units))
 
@@ -100,6 +191,12 @@ class ValueWithUnits(BaseConfiguredModel):
             return ValueWithUnits(magnitude=self.magnitude + other.magnitude, units=self.units)
 
         try:
+            if _both_scalable(self.units, other.units):
+                factor = _conversion_factor(other.units, self.units)
+                return ValueWithUnits(
+                    magnitude=self.magnitude + other.magnitude * factor,
+                    units=_canonical_units(self.units),
+                )
             pint_quantity = Q_(self.magnitude, self.units) + Q_(other.magnitude, other.units)
         except DimensionalityError as e:
             raise UnitsError(
@@ -126,6 +223,12 @@ class ValueWithUnits(BaseConfiguredModel):
             return ValueWithUnits(magnitude=self.magnitude - other.magnitude, units=self.units)
 
         try:
+            if _both_scalable(self.units, other.units):
+                factor = _conversion_factor(other.units, self.units)
+                return ValueWithUnits(
+                    magnitude=self.magnitude - other.magnitude * factor,
+                    units=_canonical_units(self.units),
+                )
             pint_quantity = Q_(self.magnitude, self.units) - Q_(other.magnitude, other.units)
         except DimensionalityError as e:
             raise UnitsError(
@@ -148,16 +251,28 @@ class ValueWithUnits(BaseConfiguredModel):
 
         if other.units == self.units:
             return self.magnitude == other.magnitude
-        self_q = Q_(self.magnitude, self.units)
 
         # Pint pythonically allows equality checks between incompatible units, but we can't
         # come up with a beneficial scenario for this behavior in TCode, so we raise an error.
+        if _both_scalable(self.units, other.units):
+            try:
+                _conversion_factor(self.units, other.units)  # raises if incompatible
+            except DimensionalityError as e:
+                raise UnitsError(
+                    f"Cannot compare quantities with incompatible units: "
+                    f"'{self.units}' and '{other.units}'"
+                ) from e
+            # Compare in root units, as the ordering operators and __hash__ do.
+            return _root_magnitude(self.magnitude, self.units) == _root_magnitude(
+                other.magnitude, other.units
+            )
+
+        self_q = Q_(self.magnitude, self.units)
         if not self_q.check(other.units):
             raise UnitsError(
                 f"Cannot compare quantities with incompatible units: "
                 f"'{self.units}' and '{other.units}'"
             )
-
         return self_q == Q_(other.magnitude, other.units)
 
     def __neg__(self) -> ValueWithUnits:
@@ -183,6 +298,11 @@ class ValueWithUnits(BaseConfiguredModel):
             return self.magnitude < other.magnitude
 
         try:
+            if _both_scalable(self.units, other.units):
+                _conversion_factor(self.units, other.units)  # raises if incompatible
+                return _root_magnitude(self.magnitude, self.units) < _root_magnitude(
+                    other.magnitude, other.units
+                )
             return Q_(self.magnitude, self.units) < Q_(other.magnitude, other.units)
         except DimensionalityError:
             raise UnitsError(
@@ -206,6 +326,11 @@ class ValueWithUnits(BaseConfiguredModel):
             return self.magnitude <= other.magnitude
 
         try:
+            if _both_scalable(self.units, other.units):
+                _conversion_factor(self.units, other.units)  # raises if incompatible
+                return _root_magnitude(self.magnitude, self.units) <= _root_magnitude(
+                    other.magnitude, other.units
+                )
             return Q_(self.magnitude, self.units) <= Q_(other.magnitude, other.units)
         except DimensionalityError:
             raise UnitsError(
@@ -229,6 +354,11 @@ class ValueWithUnits(BaseConfiguredModel):
             return self.magnitude > other.magnitude
 
         try:
+            if _both_scalable(self.units, other.units):
+                _conversion_factor(self.units, other.units)  # raises if incompatible
+                return _root_magnitude(self.magnitude, self.units) > _root_magnitude(
+                    other.magnitude, other.units
+                )
             return Q_(self.magnitude, self.units) > Q_(other.magnitude, other.units)
         except DimensionalityError:
             raise UnitsError(
@@ -252,6 +382,11 @@ class ValueWithUnits(BaseConfiguredModel):
             return self.magnitude >= other.magnitude
 
         try:
+            if _both_scalable(self.units, other.units):
+                _conversion_factor(self.units, other.units)  # raises if incompatible
+                return _root_magnitude(self.magnitude, self.units) >= _root_magnitude(
+                    other.magnitude, other.units
+                )
             return Q_(self.magnitude, self.units) >= Q_(other.magnitude, other.units)
         except DimensionalityError:
             raise UnitsError(
@@ -17,7 +17,11 @@ from .labware.pipette_tip_box.latest import (
 )
 from .labware.trash.latest import TrashDescription, TrashDescriptor
 from .labware.tube_holder.latest import TubeHolderDescription, TubeHolderDescriptor
-from .labware.union import LabwareDescription, LabwareDescriptor
+from .labware.union import (
+    LABWARE_DESCRIPTION_ADAPTER,
+    LabwareDescription,
+    LabwareDescriptor,
+)
 from .labware.well_plate.latest import WellPlateDescription, WellPlateDescriptor
 from .labware_holder.latest import LabwareHolderDescriptor
 from .pipette_tip.latest import PipetteTipDescription, PipetteTipDescriptor
@@ -46,6 +50,7 @@ from .well_bottom.union import WellBottomShapeDescription, WellBottomShapeDescri
 from .well_bottom.v_bottom.latest import VBottomDescription, VBottomDescriptor
 
 __all__ = [
+    "LABWARE_DESCRIPTION_ADAPTER",
     "AxisAlignedRectangleDescription",
     "AxisAlignedRectangleDescriptor",
     "CircleDescription",
@@ -1,6 +1,6 @@
-from typing import Annotated
+from typing import Annotated, Final
 
-from pydantic import Field
+from pydantic import Field, TypeAdapter
 
 from .lid.latest import LidDescription, LidDescriptor
 from .pipette_tip_box.latest import PipetteTipBoxDescription, PipetteTipBoxDescriptor
@@ -30,3 +30,9 @@ LabwareDescriptor = Annotated[
         description="Union type of all valid labware descriptors.",
     ),
 ]
+
+# Shared entry point for validating labware descriptions, so that loaders don't rebuild the
+# union's core schema on every call.
+LABWARE_DESCRIPTION_ADAPTER: Final[TypeAdapter[LabwareDescription]] = TypeAdapter(
+    LabwareDescription
+)
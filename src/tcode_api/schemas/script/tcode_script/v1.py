@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import datetime
+import functools
 import importlib.metadata
 import logging
 from typing import Literal, TextIO
@@ -14,6 +15,12 @@ from ..metadata.v1 import Metadata
 _logger = logging.getLogger(__name__)
 
 
+@functools.cache
+def _installed_tcode_api_version() -> str:
+    """Return the installed tcode-api version; the metadata lookup scans site-packages."""
+    return importlib.metadata.version("tcode_api")
+
+
 class TCodeScript(BaseSchemaVersionedModel):
     """Structure of a TCode script."""
 
@@ -41,7 +48,7 @@ class TCodeScript(BaseSchemaVersionedModel):
             name=name,
             description=description,
             timestamp=datetime.datetime.now().isoformat(),
-            tcode_api_version=importlib.metadata.version("tcode_api"),
+            tcode_api_version=_installed_tcode_api_version(),
         )
 
         return cls(metadata=metadata, commands=[])
@@ -55,7 +62,7 @@ class TCodeScript(BaseSchemaVersionedModel):
         :returns: The loaded TCode script.
         """
         model = super().read(file_object)
-        current_version = importlib.metadata.version("tcode_api")
+        current_version = _installed_tcode_api_version()
         if model.metadata.tcode_api_version != current_version:
             _logger.warning(
                 "Loaded TCode script was created with API version %s, current version is %s",
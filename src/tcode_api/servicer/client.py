@@ -5,9 +5,10 @@ import logging
 import os
 import time
 from itertools import batched
-from typing import Any
+from typing import Any, Final
 
 import requests
+from pydantic import TypeAdapter
 
 import tcode_api.api as tc
 from tcode_api.servicer.keyboard_input import get_key
@@ -29,6 +30,10 @@ _logger = logging.getLogger(__name__)
 
 _default_servicer_url = "http://localhost:8002"
 
+_SCHEDULE_COMMAND_RESPONSES_ADAPTER: Final[TypeAdapter[list[ScheduleCommandResponse]]] = (
+    TypeAdapter(list[ScheduleCommandResponse])
+)
+
 
 class TCodeServicerClient:
     """Python client for a TCode servicer.
@@ -124,7 +129,7 @@ class TCodeServicerClient:
             f"{self.servicer_url}/{self.tcode_api_version}/schedule", timeout=self.timeout
         )
         rsp.raise_for_status()
-        return ClearScheduleResponse.model_validate_json(rsp.text)
+        return ClearScheduleResponse.model_validate_json(rsp.content)
 
     def clear_tcode_resolution(self) -> None:
         """Clear the mapping of TCode ids to real entities on the fleet.
@@ -174,7 +179,7 @@ class TCodeServicerClient:
             f"{self.servicer_url}/{self.tcode_api_version}/status", timeout=self.timeout
         )
         rsp.raise_for_status()
-        return GetStatusResponse.model_validate_json(rsp.text)
+        return GetStatusResponse.model_validate_json(rsp.content)
 
     def serial_number_lookup(self, id: str) -> str:
         """Look up the serial number associated with a given TCode id.
@@ -189,7 +194,7 @@ class TCodeServicerClient:
             timeout=self.timeout,
         )
         rsp.raise_for_status()
-        rsp_valid = SerialNumberLookupResponse.model_validate_json(rsp.text)
+        rsp_valid = SerialNumberLookupResponse.model_validate_json(rsp.content)
         result = rsp_valid.results[id]
         if result.result.success:
             assert result.serial_number is not None  # mypy type narrowing
@@ -220,7 +225,7 @@ class TCodeServicerClient:
             _logger.debug("command: %s", command)
             _logger.debug("response: %s", rsp.text)
         rsp.raise_for_status()
-        return ScheduleCommandResponse.model_validate_json(rsp.text)
+        return ScheduleCommandResponse.model_validate_json(rsp.content)
 
     def schedule_commands(
         self, commands: list[tuple[str, tc.TCode]], tcode_api_version: str | None = None
@@ -244,7 +249,7 @@ class TCodeServicerClient:
             timeout=self.timeout,
         )
         rsp.raise_for_status()
-        return [ScheduleCommandResponse.model_validate(rsp_dict) for rsp_dict in rsp.json()]
+        return _SCHEDULE_COMMAND_RESPONSES_ADAPTER.validate_json(rsp.content)
 
     def set_run_state(self, state: bool) -> None:
         """Pause or start the execution of the current schedule.
@@ -310,7 +315,7 @@ class TCodeServicerClient:
                 json=ExitTeachModeRequest(robot_id=robot_id).model_dump(),
             )
             rsp.raise_for_status()
-            response = ExitTeachModeResponse.model_validate(rsp.json())
+            response = ExitTeachModeResponse.model_validate_json(rsp.content)
             transform = response.transform
 
         assert transform is not None, (
@@ -2,7 +2,6 @@
 
 import base64
 import functools
-import json
 import pathlib
 import site
 import uuid
@@ -47,18 +46,14 @@ class LabwareIO:
                 f"Labware directory not found: {self.labware_dir}. Please check whether tcode is installed correctly."
             )
 
-        self.labware_type_adapter: TypeAdapter = TypeAdapter(tc.LabwareDescription)
+        self.labware_type_adapter: TypeAdapter = tc.LABWARE_DESCRIPTION_ADAPTER
 
-    def _resolve_file_path(
-        self, file_path: str | pathlib.Path, exists: bool | None = None
-    ) -> pathlib.Path:
+    def _resolve_file_path(self, file_path: str | pathlib.Path) -> pathlib.Path:
         """Resolve file path to labware description file.
 
         :param file_path: Name of file or path to file containing description. If file_path is a string,
             checks tcode_api/labware for a file whose name matches file_path. If no such file exists,
             file_path is cast to a pathlib Path.
-        :param exists: If True, raises FileNotFoundError if the resolved file does not exist. If
-            False, does not check for existence. If None, doesn't check file existence.
         :return: Resolved pathlib.Path to the labware description file.
         """
         if isinstance(file_path, str):
@@ -66,10 +61,6 @@ class LabwareIO:
             if not file_path.exists():
                 file_path = pathlib.Path(file_path)
 
-        if exists is True and not file_path.exists():
-            raise FileNotFoundError(f"Labware file not found: {file_path}")
-        if exists is False and file_path.exists():
-            raise FileExistsError(f"Labware file already exists: {file_path}")
         return file_path
 
     def load(self, identifier: str | pathlib.Path) -> tc.LabwareDescription:
@@ -80,12 +71,17 @@ class LabwareIO:
             file_path is cast to a pathlib Path.
         :return: tc.LabwareDescription loaded from the file.
         """
-        file_path = self._resolve_file_path(identifier, exists=True)
-        with file_path.open("r", encoding="utf-8") as f:
-            data = f.read()
-
-        model_constructor = self.labware_type_adapter.validate_python(json.loads(data))
-        return model_constructor.model_validate_json(data)
+        file_path = self._resolve_file_path(identifier)
+        # validate_json parses UTF-8 bytes directly, so skip the text-mode decode. Opening the file
+        # is the existence check; a separate exists() would cost an extra stat per load.
+        try:
+            data = file_path.read_bytes()
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Labware file not found: {file_path}") from e
+
+        # The "type" discriminator selects the concrete description class during validation,
+        # so a single pass over the JSON is sufficient.
+        return self.labware_type_adapter.validate_json(data)
 
     def write(self, identifier: str | pathlib.Path, labware: tc.LabwareDescription) -> None:
         """Write labware description to JSON file.
@@ -11,6 +11,7 @@ from tcode_api.schemas.commands.base import (
     BaseRobotSpecificTCodeCommand,
     BaseTCodeCommand,
 )
+from tcode_api.types import identity_transform
 
 from .test_base import BaseTestCases
 
@@ -87,6 +88,77 @@ class TestTCodeEndpoints(unittest.TestCase):
                     f"\n\nACTION ITEM: Add {endpoint} to tcode_api.api.TCode type",
                 )
 
+    def test_union_dispatches_on_type_tag(self) -> None:
+        """TCode should compile to a tagged union keyed on each command's ``type`` literal.
+
+        A plain union would make pydantic try every member in turn for each command.
+        """
+        schema = tc.TCODE_ADAPTER.core_schema
+        if schema["type"] == "definitions":
+            schema = schema["schema"]
+        self.assertEqual(schema["type"], "tagged-union")
+        self.assertEqual(schema["discriminator"], "type")
+        self.assertEqual(len(schema["choices"]), len(get_args(get_args(tc.TCode)[0])))
+
+    def test_nested_model_unions_are_tagged(self) -> None:
+        """Unions of models anywhere under TCode should dispatch on a tag, not by trial parsing.
+
+        The released v1 calibration commands keep their smart union of labware locations; tagging
+        it would change which payloads validate, so it waits for a schema version bump.
+        """
+        released_smart_unions = {
+            frozenset({tc.LocationAsLabwareIndex, tc.LocationRelativeToLabware}),
+        }
+        untagged: list[list[str]] = []
+
+        def walk(node: object) -> None:
+            if isinstance(node, dict):
+                if node.get("type") == "union":
+                    choices = [c[0] if isinstance(c, tuple) else c for c in node["choices"]]
+                    if frozenset(c.get("cls") for c in choices) not in released_smart_unions:
+                        untagged.append([choice["type"] for choice in choices])
+                for value in node.values():
+                    walk(value)
+            elif isinstance(node, (list, tuple)):
+                for value in node:
+                    walk(value)
+
+        walk(tc.TCODE_ADAPTER.core_schema)
+        scalar_types = {"str", "int", "float", "bool"}
+        for choice_types in untagged:
+            self.assertLessEqual(set(choice_types), scalar_types)
+
+    def test_calibration_location_accepts_untagged_payloads(self) -> None:
+        """Calibration locations without a ``type`` key should still resolve to the right class."""
+        base = {"type": "CALIBRATE_LABWARE_HEIGHT", "robot_id": "robot", "persistent": False}
+        by_index = tc.CALIBRATE_LABWARE_HEIGHT.model_validate(
+            {**base, "location": {"labware_id": "plate", "location_index": 0, "well_part": "TOP"}}
+        )
+        self.assertIsInstance(by_index.location, tc.LocationAsLabwareIndex)
+        relative = tc.CALIBRATE_LABWARE_HEIGHT.model_validate(
+            {**base, "location": {"labware_id": "plate", "matrix": identity_transform()}}
+        )
+        self.assertIsInstance(relative.location, tc.LocationRelativeToLabware)
+
+    def test_calibration_location_ignores_stray_keys(self) -> None:
+        """An untagged relative location carrying a stray ``location_index`` should still validate.
+
+        Extra keys are ignored, so the smart union picks the member that validates.
+        """
+        command = tc.CALIBRATE_LABWARE_HEIGHT.model_validate(
+            {
+                "type": "CALIBRATE_LABWARE_HEIGHT",
+                "robot_id": "robot",
+                "persistent": False,
+                "location": {
+                    "labware_id": "plate",
+                    "matrix": identity_transform(),
+                    "location_index": 0,
+                },
+            }
+        )
+        self.assertIsInstance(command.location, tc.LocationRelativeToLabware)
+
 
 class TestScheduleCommandRequestSyncFields(unittest.TestCase):
     """Tests for envelope-level depends_on/sync_group on ScheduleCommandRequest.
@@ -7,7 +7,7 @@ from typing import Literal
 # Using the below import style because it's how we expect users to import tcode_api
 import tcode_api.api as tc
 from tcode_api.error import UnitsError
-from tcode_api.units import Q_
+from tcode_api.units import Q_, ureg
 
 
 class TestValueWithUnits(unittest.TestCase):
@@ -220,3 +220,99 @@ class TestValueWithUnits(unittest.TestCase):
                     self._are_units_equivalent(mul_result.units, test.expected_units),
                     msg=f"Expected units: {test.expected_units}, got: {mul_result.units}",
                 )
+
+    def test_to(self) -> None:
+        """to() should accept unit strings and pint Units, keeping equivalent units unchanged."""
+        volume = tc.ValueWithUnits(magnitude=5, units="mL")
+        with self.subTest(name="equivalent Unit"):
+            same = volume.to(ureg.Unit("milliliter"))
+            self.assertIsNot(same, volume)
+            self.assertEqual(same.magnitude, 5)
+            self.assertEqual(same.units, "mL")
+
+        with self.subTest(name="Unit"):
+            converted = volume.to(ureg.Unit("uL"))
+            self.assertEqual(converted.magnitude, 5000)
+            self.assertEqual(converted.units, "microliter")
+
+        with self.subTest(name="str"):
+            converted = volume.to("uL")
+            self.assertEqual(converted.magnitude, 5000)
+            self.assertEqual(converted.units, "uL")
+
+    def test_offset_units(self) -> None:
+        """Offset units (ex. temperatures) should convert and compare with their offsets applied."""
+        freezing = tc.ValueWithUnits(magnitude=0, units="degC")
+        self.assertAlmostEqual(freezing.to("kelvin").magnitude, 273.15)
+        self.assertLess(freezing, tc.ValueWithUnits(magnitude=274, units="kelvin"))
+        self.assertGreater(freezing, tc.ValueWithUnits(magnitude=272, units="kelvin"))
+
+    def test_mixed_temperature_units_follow_pint(self) -> None:
+        """Temperature arithmetic and equality should match pint's offset rules exactly."""
+        delta = tc.ValueWithUnits(magnitude=5, units="delta_degC")
+        kelvin = tc.ValueWithUnits(magnitude=2285.25, units="kelvin")
+        with self.subTest(name="add"):
+            total = delta + kelvin
+            self.assertEqual(total.units, "kelvin")
+            self.assertEqual(total.magnitude, 2290.25)
+        with self.subTest(name="sub"):
+            difference = delta - kelvin
+            self.assertEqual(difference.units, "kelvin")
+            self.assertEqual(difference.magnitude, -2280.25)
+
+        for absolute, relative in [("degC", "delta_degC"), ("degF", "delta_degF")]:
+            with self.subTest(absolute=absolute, relative=relative):
+                self.assertFalse(
+                    tc.ValueWithUnits(magnitude=5, units=absolute)
+                    == tc.ValueWithUnits(magnitude=5, units=relative)
+                )
+
+    def test_hash_consistent_with_equality(self) -> None:
+        """Equal values expressed in different units should hash equally."""
+        tests = [
+            (
+                tc.ValueWithUnits(magnitude=5, units="mL"),
+                tc.ValueWithUnits(magnitude=0.005, units="L"),
+            ),
+            (
+                tc.ValueWithUnits(magnitude=5, units="mL"),
+                tc.ValueWithUnits(magnitude=5000, units="uL"),
+            ),
+            (
+                tc.ValueWithUnits(magnitude=1.5, units="m"),
+                tc.ValueWithUnits(magnitude=1500, units="mm"),
+            ),
+            (
+                tc.ValueWithUnits(magnitude=0, units="degC"),
+                tc.ValueWithUnits(magnitude=0, units="degC"),
+            ),
+            (
+                tc.ValueWithUnits(magnitude=3, units="steps"),
+                tc.ValueWithUnits(magnitude=3, units="steps"),
+            ),
+        ]
+        for a, b in tests:
+            with self.subTest(a=str(a), b=str(b)):
+                self.assertEqual(a, b)
+                self.assertEqual(hash(a), hash(b))
+                self.assertEqual(len({a, b}), 1)
+
+        # Converted values that sit on a rounding boundary should still compare and hash equal.
+        for magnitude in [4176.971212614999, 7.0, 0.1, 123456.789]:
+            litres = tc.ValueWithUnits(magnitude=magnitude, units="L")
+            millilitres = litres.to("mL")
+            with self.subTest(a=str(litres), b=str(millilitres)):
+                self.assertEqual(litres, millilitres)
+                self.assertEqual(hash(litres), hash(millilitres))
+
+    def test_hash_spreads_same_unit_values(self) -> None:
+        """Distinct values in the same units should not all land in one hash bucket."""
+        values = [tc.ValueWithUnits(magnitude=float(i), units="uL") for i in range(100)]
+        self.assertEqual(len({hash(value) for value in values}), len(values))
+
+    def test_hash_accepts_unparseable_units(self) -> None:
+        """Hashing should not raise for units strings pint cannot parse."""
+        for units in ["steps", "(mm", "mm + mL", "mm^x", "3", "1/0"]:
+            with self.subTest(units=units):
+                value = tc.ValueWithUnits(magnitude=1, units=units)
+                self.assertEqual(hash(value), hash(value.model_copy()))
@@ -0,0 +1,46 @@
+"""Unittests for tcode_api.error."""
+
+import unittest
+
+from tcode_api.error import (
+    TCODE_RESULT_REPORT_ADAPTER,
+    ExecutionCode,
+    ExecutionResult,
+    ResolverCode,
+    ResolverResult,
+)
+
+
+class TestResultFactories(unittest.TestCase):
+    """Unittests for the ``ok()``/``error()`` factories on result classes."""
+
+    def test_default_details_are_independent_dicts(self) -> None:
+        """Results created without details should each own a mutable, empty dict."""
+        results = [
+            ResolverResult.ok(),
+            ResolverResult.error(ResolverCode.INTERNAL_ERROR, "oops"),
+            ExecutionResult.ok(),
+            ExecutionResult.error(ExecutionCode.INTERNAL_ERROR, "oops"),
+        ]
+        for result in results:
+            with self.subTest(result=result):
+                self.assertIsInstance(result.details, dict)
+                self.assertEqual(result.details, {})
+
+        results[0].details["key"] = "value"
+        self.assertEqual(ResolverResult.ok().details, {})
+
+    def test_provided_details_are_kept(self) -> None:
+        """Details passed to a factory should be preserved on the result."""
+        result = ExecutionResult.error(ExecutionCode.INTERNAL_ERROR, "oops", details={"a": 1})
+        self.assertEqual(result.details, {"a": 1})
+
+
+class TestTCodeResultReportAdapter(unittest.TestCase):
+    """Unittests for ``TCODE_RESULT_REPORT_ADAPTER``."""
+
+    def test_json_round_trip(self) -> None:
+        """Result reports should round-trip through the shared adapter as their concrete class."""
+        report = ResolverResult.error(ResolverCode.ID_EXISTS, "duplicate", details={"id": "a"})
+        data = TCODE_RESULT_REPORT_ADAPTER.dump_json(report)
+        self.assertEqual(TCODE_RESULT_REPORT_ADAPTER.validate_json(data), report)
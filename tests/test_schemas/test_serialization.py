@@ -67,3 +67,23 @@ class TestSchemaDeserialization(unittest.TestCase):
                 ),
             ):
                 PipetteTipBoxDescriptionV2.read(f)
+
+    def test_write_matches_pydantic_json(self) -> None:
+        """write() should emit exactly what pydantic's indented JSON encoder produces."""
+        with tempfile.TemporaryFile(mode="w+", encoding="utf-8") as text_io:
+            self.pipette_tip_box_description.write(text_io)
+            text_io.seek(0)
+            written = text_io.read()
+
+        self.assertEqual(written, self.pipette_tip_box_description.model_dump_json(indent=2))
+
+        # orjson can't encode integers beyond 64 bits; write() must still match pydantic.
+        big_int_description = self.pipette_tip_box_description.model_copy(
+            update={"named_tags": {"lot": 2**64}}
+        )
+        with tempfile.TemporaryFile(mode="w+", encoding="utf-8") as text_io:
+            big_int_description.write(text_io)
+            text_io.seek(0)
+            written = text_io.read()
+
+        self.assertEqual(written, big_int_description.model_dump_json(indent=2))
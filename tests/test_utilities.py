@@ -11,6 +11,7 @@ from tcode_api.utilities import (
     describe_pipette_tip_box,
     describe_pipette_tip_group,
     describe_well_plate,
+    load_labware,
     well_address_to_index,
 )
 
@@ -97,3 +98,12 @@ class TestWellAddressToIndex(unittest.TestCase):
             with self.subTest(address=address):
                 with self.assertRaises(expected_exception):
                     well_address_to_index(address)
+
+
+class TestLoadLabware(unittest.TestCase):
+    """Test loading labware descriptions from disk."""
+
+    def test_missing_labware_raises(self) -> None:
+        """A labware name with no matching file should raise FileNotFoundError naming the path."""
+        with self.assertRaisesRegex(FileNotFoundError, "Labware file not found: .*nope.json"):
+            load_labware("nope")